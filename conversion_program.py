@@ -7,6 +7,12 @@ import os
 import sys
 from PIL import Image, ImageTk  # Für Bildverarbeitung
 import locale
+import time
+import functools
+import cProfile
+import pstats
+import io
+import tracemalloc
 
 # Zusätzliche Importe für die Erstellung einer Desktop-Verknüpfung
 try:
@@ -17,10 +23,215 @@ except ImportError:
     messagebox.showerror("Module Error", "Bitte installieren Sie die Module 'winshell' und 'pywin32':\npip install winshell pywin32")
     sys.exit(1)
 
+class Profiler:
+    """Optionales Profiling für GUI- und Konvertierungs-Hotpaths.
+
+    Aktivierung über die Umgebungsvariable SW_CONVERTER_PROFILE oder das
+    Kommandozeilen-Flag --profile. Der Wert "full" (bzw. --profile=full)
+    zeichnet zusätzlich cProfile- und tracemalloc-Daten auf.
+    """
+
+    STALL_CHECK_INTERVAL_MS = 50
+    DEFAULT_STALL_THRESHOLD_MS = 200
+    MAX_STALLS = 500
+
+    def __init__(self, full=False, output_dir='profiling', stall_threshold_ms=DEFAULT_STALL_THRESHOLD_MS):
+        self.full = full
+        self.output_dir = output_dir
+        self.stall_threshold = stall_threshold_ms / 1000.0
+        self.timings = {}  # Name -> [Anzahl, Gesamtzeit, Maximalzeit]
+        self.stalls = []  # Liste von (Sekunden seit Start, Dauer, seit dem letzten Tick beendete Abschnitte)
+        self.finished_sections = []  # Seit dem letzten Tick beendete Abschnitte
+        self.start_time = time.perf_counter()
+        self._last_tick = None
+        self._after_id = None
+        self._stall_widget = None
+        self.stalls_dropped = 0
+        self.dialog_time = 0.0  # Gesamtzeit in modalen Dialogen
+        self._original_dialogs = {}
+        self._dump_count = 0
+        self.cprofile = None
+        self._started_tracemalloc = False
+
+        if self.full:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+
+    @classmethod
+    def from_environment(cls):
+        # Profiling nur aktivieren, wenn ausdrücklich gewünscht
+        mode = os.environ.get('SW_CONVERTER_PROFILE', '').strip().lower()
+        for arg in sys.argv[1:]:
+            if arg == '--profile':
+                mode = mode or '1'
+            elif arg.startswith('--profile='):
+                mode = arg.split('=', 1)[1].strip().lower()
+        if mode in ('', '0', 'false', 'off', 'no'):
+            return None
+
+        try:
+            threshold = int(os.environ.get('SW_CONVERTER_STALL_MS', cls.DEFAULT_STALL_THRESHOLD_MS))
+        except ValueError:
+            threshold = cls.DEFAULT_STALL_THRESHOLD_MS
+        if threshold <= 0:
+            threshold = cls.DEFAULT_STALL_THRESHOLD_MS
+        # Schwellwerte unterhalb des Prüfintervalls würden normales Scheduler-Jitter als Stall melden
+        threshold = max(threshold, cls.STALL_CHECK_INTERVAL_MS)
+        return cls(full=(mode == 'full'), stall_threshold_ms=threshold)
+
+    def record(self, name, duration):
+        entry = self.timings.get(name)
+        if entry is None:
+            self.timings[name] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            if duration > entry[2]:
+                entry[2] = duration
+        if name not in self.finished_sections:
+            self.finished_sections.append(name)
+
+    def wrap(self, name, func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            dialog_start = self.dialog_time
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Zeit in modalen Dialogen nicht als Arbeitszeit zählen
+                self.record(name, time.perf_counter() - start - (self.dialog_time - dialog_start))
+        return timed
+
+    def track_dialogs(self, module, dialog_names=('showerror', 'showinfo', 'showwarning')):
+        # Messagebox-Funktionen ersetzen, um die Wartezeit auf den Benutzer zu erfassen
+        def make_tracked(func):
+            @functools.wraps(func)
+            def tracked(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.dialog_time += time.perf_counter() - start
+            return tracked
+
+        for name in dialog_names:
+            original = getattr(module, name)
+            self._original_dialogs[name] = (module, original)
+            setattr(module, name, make_tracked(original))
+
+    def instrument(self, obj, method_names):
+        # Gebundene Methoden auf der Instanz durch zeitgemessene Versionen ersetzen
+        for name in method_names:
+            setattr(obj, name, self.wrap(name, getattr(obj, name)))
+
+    def start_stall_watch(self, widget):
+        # Prüft regelmäßig, ob die Tk-Ereignisschleife länger als erwartet blockiert war
+        self._last_tick = time.perf_counter()
+        self._stall_widget = widget
+        interval = self.STALL_CHECK_INTERVAL_MS
+
+        def tick():
+            now = time.perf_counter()
+            lag = now - self._last_tick - interval / 1000.0
+            if lag > self.stall_threshold:
+                if len(self.stalls) < self.MAX_STALLS:
+                    self.stalls.append((now - self.start_time, lag, tuple(self.finished_sections)))
+                else:
+                    self.stalls_dropped += 1
+            # Nur Abschnitte seit dem letzten Tick einem Stall zuordnen
+            self.finished_sections = []
+            self._last_tick = now
+            self._after_id = widget.after(interval, tick)
+
+        self._after_id = widget.after(interval, tick)
+
+    def summary(self):
+        lines = []
+        elapsed = time.perf_counter() - self.start_time
+        lines.append(f"Session duration: {elapsed:.1f} s")
+        lines.append(f"Mode: {'full (cProfile + tracemalloc)' if self.full else 'timers'}")
+        lines.append("Method timings exclude time spent waiting in message dialogs.")
+        lines.append("")
+        lines.append(f"{'Method':<28}{'Calls':>8}{'Total ms':>12}{'Avg ms':>10}{'Max ms':>10}")
+        for name, (count, total, maximum) in sorted(self.timings.items(), key=lambda item: item[1][1], reverse=True):
+            lines.append(f"{name:<28}{count:>8}{total * 1000:>12.1f}{total / count * 1000:>10.1f}{maximum * 1000:>10.1f}")
+        if not self.timings:
+            lines.append("(no timed calls yet)")
+        lines.append(f"Time spent in message dialogs: {self.dialog_time * 1000:.1f} ms")
+
+        lines.append("")
+        lines.append(f"Event loop stalls > {self.stall_threshold * 1000:.0f} ms: {len(self.stalls) + self.stalls_dropped}")
+        if self.stalls_dropped:
+            lines.append(f"  (limit of {self.MAX_STALLS} recorded stalls reached, {self.stalls_dropped} not recorded in detail)")
+        for at, duration, sections in sorted(self.stalls, key=lambda stall: stall[1], reverse=True)[:20]:
+            lines.append(f"  at {at:8.2f} s  {duration * 1000:8.1f} ms  (timed during stall: {', '.join(sections) or '-'})")
+
+        if self.full:
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append("")
+            lines.append(f"tracemalloc: current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB")
+        return "\n".join(lines)
+
+    def dump(self):
+        # Ergebnisse in Dateien schreiben und das Ausgabeverzeichnis zurückgeben
+        os.makedirs(self.output_dir, exist_ok=True)
+        # Zähler verhindert das Überschreiben bei mehreren Dumps innerhalb einer Sekunde
+        self._dump_count += 1
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S')}-{self._dump_count}"
+
+        with open(os.path.join(self.output_dir, f'timings-{stamp}.txt'), 'w', encoding='utf-8') as f:
+            f.write(self.summary() + "\n")
+
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            try:
+                self.cprofile.dump_stats(os.path.join(self.output_dir, f'cprofile-{stamp}.prof'))
+                stream = io.StringIO()
+                pstats.Stats(self.cprofile, stream=stream).sort_stats('cumulative').print_stats(40)
+                with open(os.path.join(self.output_dir, f'cprofile-{stamp}.txt'), 'w', encoding='utf-8') as f:
+                    f.write(stream.getvalue())
+            finally:
+                # Profiling auch nach einem Schreibfehler fortsetzen
+                self.cprofile.enable()
+
+        if self.full:
+            snapshot = tracemalloc.take_snapshot()
+            with open(os.path.join(self.output_dir, f'tracemalloc-{stamp}.txt'), 'w', encoding='utf-8') as f:
+                for stat in snapshot.statistics('lineno')[:40]:
+                    f.write(f"{stat}\n")
+
+        return os.path.abspath(self.output_dir)
+
+    def stop(self):
+        if self._after_id is not None:
+            self._stall_widget.after_cancel(self._after_id)
+            self._after_id = None
+        for name, (module, original) in self._original_dialogs.items():
+            setattr(module, name, original)
+        self._original_dialogs = {}
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
 class Application(TkinterDnD.Tk):
     def __init__(self):
         super().__init__()
 
+        # Optionales Profiling (SW_CONVERTER_PROFILE bzw. --profile)
+        self.profiler = Profiler.from_environment()
+        if self.profiler:
+            self.profiler.instrument(self, [
+                'update_image_grid', 'get_available_languages', 'save_to_xml',
+                'save_config', 'run_compiler', 'convert',
+            ])
+            self.profiler.track_dialogs(messagebox)
+
         # Internationalisierung einrichten
         self.translations = {}
         self.current_language = 'en_US'  # Standard-Sprache
@@ -47,6 +258,10 @@ class Application(TkinterDnD.Tk):
         # Pfade aus XML laden, falls vorhanden
         self.load_from_xml()
 
+        if self.profiler:
+            self.profiler.start_stall_watch(self)
+            self.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def load_translation(self, language_code):
         translation_file = os.path.join('languages', f'{language_code}.xml')
         if not os.path.exists(translation_file):
@@ -207,6 +422,11 @@ class Application(TkinterDnD.Tk):
         self.shortcut_button = ttk.Button(self.buttons_frame, text=self.translations.get("create_shortcut", "Create Shortcut"), command=self.create_shortcut)
         self.shortcut_button.grid(row=0, column=2, padx=5)
 
+        # Diagnostics Button (nur im Profiling-Modus)
+        if self.profiler:
+            self.diagnostics_button = ttk.Button(self.buttons_frame, text=self.translations.get("diagnostics", "Diagnostics"), command=self.show_diagnostics)
+            self.diagnostics_button.grid(row=0, column=3, padx=5)
+
         # Drag-and-Drop Area
         self.drag_drop_label = ttk.Label(self, text=self.translations.get("drag_drop", "Drag and drop files here:"))
         self.drag_drop_label.pack(pady=2, anchor='w', padx=10)
@@ -279,6 +499,8 @@ class Application(TkinterDnD.Tk):
         self.convert_button.config(text=self.translations.get("convert", "Convert"))
         self.help_button.config(text=self.translations.get("help", "Help"))
         self.shortcut_button.config(text=self.translations.get("create_shortcut", "Create Shortcut"))
+        if self.profiler:
+            self.diagnostics_button.config(text=self.translations.get("diagnostics", "Diagnostics"))
 
         self.drag_drop_label.config(text=self.translations.get("drag_drop", "Drag and drop files here:"))
 
@@ -547,19 +769,22 @@ class Application(TkinterDnD.Tk):
                 CREATE_NO_WINDOW = 0  # Für Nicht-Windows-Systeme
 
             try:
-                # Befehl in PowerShell unter C:\WINDOWS\system32 ausführen
-                subprocess.run(
-                    ["powershell", "-Command", command],
-                    cwd=r"C:\WINDOWS\system32",
-                    check=True,
-                    creationflags=CREATE_NO_WINDOW
-                )
+                self.run_compiler(command, CREATE_NO_WINDOW)
             except subprocess.CalledProcessError as e:
                 # Fehlermeldung anzeigen
                 messagebox.showerror(texts.get("error", "Error"), f"{texts.get('an_error_occurred', 'An error occurred:')}\n{e}")
             except Exception as e:
                 messagebox.showerror(texts.get("error", "Error"), f"{texts.get('unexpected_error_occurred', 'An unexpected error occurred:')}\n{e}")
 
+    def run_compiler(self, command, creationflags):
+        # Befehl in PowerShell unter C:\WINDOWS\system32 ausführen
+        subprocess.run(
+            ["powershell", "-Command", command],
+            cwd=r"C:\WINDOWS\system32",
+            check=True,
+            creationflags=creationflags
+        )
+
     def show_help(self):
         texts = self.translations
 
@@ -608,6 +833,49 @@ class Application(TkinterDnD.Tk):
         text_widget.configure(state='disabled')  # Nur-Lese-Modus
         text_widget.pack(expand=True, fill=tk.BOTH)
 
+    def show_diagnostics(self):
+        texts = self.translations
+        # Neues Fenster mit der Profiling-Zusammenfassung erstellen
+        diagnostics_window = tk.Toplevel(self)
+        diagnostics_window.title(texts.get("diagnostics_title", "Diagnostics"))
+        diagnostics_window.geometry("600x400+600+500")
+        diagnostics_window.focus_force()
+
+        text_widget = tk.Text(diagnostics_window, wrap=tk.NONE, font=("Courier", 9))
+
+        def refresh():
+            text_widget.configure(state='normal')
+            text_widget.delete('1.0', tk.END)
+            text_widget.insert(tk.END, self.profiler.summary())
+            text_widget.configure(state='disabled')  # Nur-Lese-Modus
+
+        def save_report():
+            try:
+                output_dir = self.profiler.dump()
+                messagebox.showinfo(texts.get("diagnostics_title", "Diagnostics"), f"{texts.get('diagnostics_saved', 'Profiling data saved to:')}\n{output_dir}", parent=diagnostics_window)
+            except Exception as e:
+                messagebox.showerror(texts.get("error", "Error"), f"{texts.get('diagnostics_save_failed', 'Failed to save profiling data:')}\n{e}", parent=diagnostics_window)
+            refresh()
+
+        buttons = ttk.Frame(diagnostics_window)
+        buttons.pack(side=tk.BOTTOM, pady=5)
+        ttk.Button(buttons, text=texts.get("refresh", "Refresh"), command=refresh).grid(row=0, column=0, padx=5)
+        ttk.Button(buttons, text=texts.get("save_report", "Save Report"), command=save_report).grid(row=0, column=1, padx=5)
+
+        text_widget.pack(expand=True, fill=tk.BOTH)
+        refresh()
+
+    def on_close(self):
+        texts = self.translations
+        # Profiling-Daten beim Beenden sichern
+        try:
+            output_dir = self.profiler.dump()
+            messagebox.showinfo(texts.get("diagnostics_title", "Diagnostics"), f"{texts.get('diagnostics_saved', 'Profiling data saved to:')}\n{output_dir}")
+        except Exception as e:
+            messagebox.showerror(texts.get("error", "Error"), f"{texts.get('diagnostics_save_failed', 'Failed to save profiling data:')}\n{e}")
+        self.profiler.stop()
+        self.destroy()
+
     def create_shortcut(self):
         texts = self.translations
         try: